@@ -286,6 +286,9 @@ def rotation_matrix(phi):
 def sympmat(n):
     r""" Returns the symplectic matrix of order n
 
+    The returned array is cached and marked read-only; copy it before
+    modifying it in place.
+
     Args:
         n (int): order
         hbar (float): the value of hbar used in the definition
@@ -296,6 +299,7 @@ def sympmat(n):
     idm = np.identity(n)
     omega = np.concatenate((np.concatenate((0*idm, idm), axis=1),
                             np.concatenate((-idm, 0*idm), axis=1)), axis=0)
+    omega.setflags(write=False)
     return omega
 
 
@@ -306,6 +310,9 @@ def changebasis(n):
     This is the matrix necessary to transform covariances matrices written
     in the (x_1,...,x_n,p_1,...,p_n) to the (x_1,p_1,...,x_n,p_n) ordering
 
+    The returned array is cached and marked read-only; copy it before
+    modifying it in place.
+
     Args:
         n (int): number of modes
     Returns:
@@ -315,6 +322,7 @@ def changebasis(n):
     for i in range(n):
         m[2*i, i] = 1
         m[2*i+1, i+n] = 1
+    m.setflags(write=False)
     return m
 
 
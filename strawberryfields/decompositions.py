@@ -42,14 +42,33 @@ Code details
 
 """
 
+import cmath
+import functools
+import math
 from itertools import groupby
 
 import numpy as np
-from scipy.linalg import block_diag, sqrtm, polar, schur
+from scipy.linalg import LinAlgError, cholesky, eig, polar, schur, solve, sqrtm, svd
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
 
 from .backends.shared_ops import sympmat, changebasis
 
 
+def _jit(fn):
+    r"""Compiles fn in numba nopython mode if numba is available.
+
+    Numba is an optional dependency; without it the undecorated
+    Python function is used directly.
+    """
+    if njit is None:  # pragma: no cover
+        return fn
+    return njit(fn, cache=True)
+
+
 def takagi(N, tol=1e-13, rounding=13):
     r"""Autonne-Takagi decomposition of a complex symmetric (not Hermitian!) matrix.
 
@@ -72,7 +91,20 @@ def takagi(N, tol=1e-13, rounding=13):
     if np.linalg.norm(N-np.transpose(N)) >= tol:
         raise ValueError("The input matrix is not symmetric")
 
-    v, l, ws = np.linalg.svd(N)
+    if np.isrealobj(N):
+        # For a real symmetric matrix the Takagi decomposition follows
+        # directly from the real eigendecomposition, which is considerably
+        # cheaper than a complex SVD: columns belonging to negative
+        # eigenvalues absorb the sign into a phase of i
+        w, v = np.linalg.eigh(N)
+        order = np.argsort(-np.abs(w))
+        w = w[order]
+        U = v[:, order] * np.where(w >= 0, 1.0, 1.0j)
+        return np.round(np.abs(w), rounding), U
+
+    # check_finite=False skips scipy's validation pass (and its copy);
+    # the input has already been validated above
+    v, l, ws = svd(N, full_matrices=False, check_finite=False, lapack_driver='gesdd')
     w = np.transpose(np.conjugate(ws))
     rl = np.round(l, rounding)
 
@@ -88,21 +120,20 @@ def takagi(N, tol=1e-13, rounding=13):
             k[ind] = kk
             kk = kk+1
 
-    # Generate the lists with the degenerate column subspaces
-    vas = []
-    was = []
-    for i in result:
-        vas.append(v[:, i])
-        was.append(w[:, i])
+    # Generate the matrices qs of the degenerate subspaces, stamping them
+    # directly into a preallocated block-diagonal matrix
+    qb = np.zeros((n, n), dtype=np.complex128)
 
-    # Generate the matrices qs of the degenerate subspaces
-    qs = []
-    for i in range(len(result)):
-        qs.append(sqrtm(np.transpose(vas[i]) @ was[i]))
+    if all(len(k) == 1 for k in result):
+        # Non-degenerate singular values: every block is 1x1, so qb is
+        # diagonal and the matrix square roots reduce to scalar ones
+        np.fill_diagonal(qb, np.sqrt(np.einsum('ij,ij->j', v, w)))
+    else:
+        for k in result:
+            sl = slice(k[0], k[-1]+1)
+            qb[sl, sl] = sqrtm(np.transpose(v[:, sl]) @ w[:, sl])
 
     # Construct the Takagi unitary
-    qb = block_diag(*qs)
-
     U = v @ np.conj(qb)
     return rl, U
 
@@ -148,9 +179,17 @@ def graph_embed(A, max_mean_photon=1.0, make_traceless=True, tol=1e-6):
     return vals, U
 
 
+@functools.lru_cache()
+def _eye_complex(nmax):
+    r"""Cached complex identity template; copy it before modifying."""
+    eye = np.identity(nmax, dtype=np.complex128)
+    eye.setflags(write=False)
+    return eye
+
+
 def T(m, n, theta, phi, nmax):
     r"""The Clements T matrix from Eq. 1 of the paper"""
-    mat = np.identity(nmax, dtype=np.complex128)
+    mat = _eye_complex(nmax).copy()
     mat[m, m] = np.exp(1j*phi)*np.cos(theta)
     mat[m, n] = -np.sin(theta)
     mat[n, m] = np.exp(1j*phi)*np.sin(theta)
@@ -163,6 +202,68 @@ def Ti(m, n, theta, phi, nmax):
     return np.transpose(T(m, n, theta, -phi, nmax))
 
 
+def _givens_rows_inplace(U, m, n, a, b, c, s):
+    r"""Two-row Givens update ``rows m, n <- (a*row_m - s*row_n, b*row_m + c*row_n)``
+    applied in place."""
+    row_m = U[m].copy()
+    row_n = U[n]
+    U[m] = a*row_m - s*row_n
+    U[n] = b*row_m + c*row_n
+
+
+def _givens_cols_inplace(U, m, n, a, b, c, s):
+    r"""Two-column Givens update ``cols m, n <- (a*col_m - s*col_n, b*col_m + c*col_n)``
+    applied in place."""
+    col_m = U[:, m].copy()
+    col_n = U[:, n]
+    U[:, m] = a*col_m - s*col_n
+    U[:, n] = b*col_m + c*col_n
+
+
+if njit is not None:
+    # Under numba the explicit element loops below compile to streaming
+    # fused multiply-adds over the two rows/columns, with none of the
+    # temporaries of the slice-based fallbacks above
+    def _givens_rows_loop(U, m, n, a, b, c, s):
+        for k in range(U.shape[1]):
+            um = U[m, k]
+            un = U[n, k]
+            U[m, k] = a*um - s*un
+            U[n, k] = b*um + c*un
+
+    def _givens_cols_loop(U, m, n, a, b, c, s):
+        for k in range(U.shape[0]):
+            um = U[k, m]
+            un = U[k, n]
+            U[k, m] = a*um - s*un
+            U[k, n] = b*um + c*un
+
+    _givens_rows_inplace = njit(_givens_rows_loop, cache=True, fastmath=True)
+    _givens_cols_inplace = njit(_givens_cols_loop, cache=True, fastmath=True)
+
+
+@_jit
+def _apply_T_left(U, m, n, theta, phi):
+    r"""Applies ``T(m, n, theta, phi, nmax) @ U`` in place.
+
+    Only rows m and n of U differ from the identity action, so the full
+    nmax x nmax matrix multiplication is replaced by a two-row update.
+    """
+    c, s, e = math.cos(theta), math.sin(theta), cmath.exp(1j*phi)
+    _givens_rows_inplace(U, m, n, e*c, e*s, c, s)
+
+
+@_jit
+def _apply_Ti_right(U, m, n, theta, phi):
+    r"""Applies ``U @ Ti(m, n, theta, phi, nmax)`` in place.
+
+    Only columns m and n of U differ from the identity action, so the full
+    nmax x nmax matrix multiplication is replaced by a two-column update.
+    """
+    c, s, e = math.cos(theta), math.sin(theta), cmath.exp(-1j*phi)
+    _givens_cols_inplace(U, m, n, e*c, e*s, c, s)
+
+
 def nullTi(m, n, U):
     r"""Nullifies element m,n of U using Ti"""
     (nmax, mmax) = U.shape
@@ -199,7 +300,91 @@ def nullT(n, m, U):
     return [n-1, n, thetar, phir, nmax]
 
 
-def clements(V, tol=1e-11):
+@_jit
+def _clements_core(localV):
+    r"""Nullification loops of the Clements decomposition.
+
+    Operates in place on localV and returns the ``(m, n, theta, phi)``
+    parameters of the Ti and T gates found, as two float arrays. The
+    interpreter-bound loop is compiled by numba when available.
+    """
+    nsize = localV.shape[0]
+    ngates = nsize*(nsize-1)//2
+    ti_params = np.zeros((ngates, 4))
+    t_params = np.zeros((ngates, 4))
+    n_ti = 0
+    n_t = 0
+    for k in range(nsize-1):
+        i = nsize-2-k
+        if k % 2 == 0:
+            for j in range(nsize-2-i, -1, -1):
+                # nullifies element i+j+1, j using Ti
+                m, n = i+j+1, j
+                if localV[m, n+1] == 0:
+                    thetar = math.pi/2
+                    phir = 0.0
+                else:
+                    r = localV[m, n] / localV[m, n+1]
+                    thetar = math.atan(abs(r))
+                    phir = math.atan2(r.imag, r.real)
+                ti_params[n_ti, 0] = n
+                ti_params[n_ti, 1] = n+1
+                ti_params[n_ti, 2] = thetar
+                ti_params[n_ti, 3] = phir
+                n_ti += 1
+                _apply_Ti_right(localV, n, n+1, thetar, phir)
+        else:
+            for j in range(nsize-1-i):
+                # nullifies element i+j+1, j using T
+                n, m = i+j+1, j
+                if localV[n-1, m] == 0:
+                    thetar = math.pi/2
+                    phir = 0.0
+                else:
+                    r = -localV[n, m] / localV[n-1, m]
+                    thetar = math.atan(abs(r))
+                    phir = math.atan2(r.imag, r.real)
+                t_params[n_t, 0] = n-1
+                t_params[n_t, 1] = n
+                t_params[n_t, 2] = thetar
+                t_params[n_t, 3] = phir
+                n_t += 1
+                _apply_T_left(localV, n-1, n, thetar, phir)
+    return ti_params[:n_ti], t_params[:n_t]
+
+
+@_jit
+def _triangular_core(localV):
+    r"""Nullification loop of the triangular decomposition.
+
+    Operates in place on localV and returns the ``(m, n, theta, phi)``
+    parameters of the T gates found as a float array.
+    """
+    nsize = localV.shape[0]
+    ngates = nsize*(nsize-1)//2
+    t_params = np.zeros((ngates, 4))
+    n_t = 0
+    for i in range(nsize-2, -1, -1):
+        for j in range(i+1):
+            # nullifies element nsize-j-1, nsize-i-2 using T
+            n, m = nsize-j-1, nsize-i-2
+            if localV[n-1, m] == 0:
+                thetar = math.pi/2
+                phir = 0.0
+            else:
+                r = -localV[n, m] / localV[n-1, m]
+                thetar = math.atan(abs(r))
+                phir = math.atan2(r.imag, r.real)
+            t_params[n_t, 0] = n-1
+            t_params[n_t, 1] = n
+            t_params[n_t, 2] = thetar
+            t_params[n_t, 3] = phir
+            n_t += 1
+            _apply_T_left(localV, n-1, n, thetar, phir)
+    return t_params
+
+
+def clements(V, tol=1e-11, check_unitary=True):
     r"""Clements decomposition of a unitary matrix, with local
     phase shifts applied between two interferometers.
 
@@ -217,6 +402,8 @@ def clements(V, tol=1e-11):
         V (array[complex]): unitary matrix of size n_size
         tol (float): the tolerance used when checking if the matrix is unitary:
             :math:`|VV^\dagger-I| \leq` tol
+        check_unitary (bool): whether to verify that V is unitary. Callers that
+            have already validated V can skip the :math:`O(n^3)` check
 
     Returns:
         tuple[array]: tuple of the form ``(tilist,tlist,np.diag(localV))``
@@ -226,29 +413,32 @@ def clements(V, tol=1e-11):
             * ``tlist``: list containing ``[n,m,theta,phi,n_size]`` of the T unitaries needed
             * ``localV``: Diagonal unitary sitting sandwiched by Ti's and the T's
     """
-    localV = V
+    localV = np.array(V, dtype=np.complex128)
     (nsize, _) = localV.shape
 
-    diffn = np.linalg.norm(V @ V.conj().T - np.identity(nsize))
-    if diffn >= tol:
-        raise ValueError("The input matrix is not unitary")
+    if check_unitary:
+        diffn = np.linalg.norm(V @ V.conj().T - np.identity(nsize))
+        if diffn >= tol:
+            raise ValueError("The input matrix is not unitary")
 
-    tilist = []
-    tlist = []
-    for k, i in enumerate(range(nsize-2, -1, -1)):
-        if k % 2 == 0:
-            for j in reversed(range(nsize-1-i)):
-                tilist.append(nullTi(i+j+1, j, localV))
-                localV = localV @ Ti(*tilist[-1])
-        else:
-            for j in range(nsize-1-i):
-                tlist.append(nullT(i+j+1, j, localV))
-                localV = T(*tlist[-1]) @ localV
+    # For one or two modes the decomposition is known in closed form, so
+    # the general nullification machinery is skipped
+    if nsize == 1:
+        return [], [], np.diag(localV)
+
+    if nsize == 2:
+        gate = nullTi(1, 0, localV)
+        _apply_Ti_right(localV, gate[0], gate[1], gate[2], gate[3])
+        return [gate], [], np.diag(localV)
+
+    ti_params, t_params = _clements_core(localV)
+    tilist = [[int(p[0]), int(p[1]), p[2], p[3], nsize] for p in ti_params]
+    tlist = [[int(p[0]), int(p[1]), p[2], p[3], nsize] for p in t_params]
 
     return tilist, tlist, np.diag(localV)
 
 
-def clements_phase_end(V, tol=1e-11):
+def clements_phase_end(V, tol=1e-11, check_unitary=True):
     r"""Clements decomposition of a unitary matrix.
 
     See :cite:`clements2016` for more details.
@@ -260,6 +450,8 @@ def clements_phase_end(V, tol=1e-11):
         V (array[complex]): unitary matrix of size n_size
         tol (float): the tolerance used when checking if the matrix is unitary:
             :math:`|VV^\dagger-I| \leq` tol
+        check_unitary (bool): whether to verify that V is unitary. Callers that
+            have already validated V can skip the :math:`O(n^3)` check
 
     Returns:
         tuple[array]: returns a tuple of the form ``(tlist,np.diag(localV))``
@@ -268,25 +460,28 @@ def clements_phase_end(V, tol=1e-11):
             * ``tlist``: list containing ``[n,m,theta,phi,n_size]`` of the T unitaries needed
             * ``localV``: Diagonal unitary matrix to be applied at the end of circuit
     """
-    tilist, tlist, diags = clements(V, tol)
+    tilist, tlist, diags = clements(V, tol, check_unitary=check_unitary)
     new_tlist, new_diags = tilist.copy(), diags.copy()
 
-    # Push each beamsplitter through the diagonal unitary
+    # Push each beamsplitter through the diagonal unitary.
+    # The per-iteration work is pure scalar arithmetic, so plain math/cmath
+    # calls are used to avoid NumPy's ufunc dispatch overhead.
     for i in reversed(tlist):
         em, en = int(i[0]), int(i[1])
-        alpha, beta = np.angle(new_diags[em]), np.angle(new_diags[en])
+        alpha = math.atan2(new_diags[em].imag, new_diags[em].real)
+        beta = math.atan2(new_diags[en].imag, new_diags[en].real)
         theta, phi = i[2], i[3]
 
         # The new parameters required for D',T' st. T^(-1)D = D'T'
         new_theta = theta
-        new_phi = np.fmod((alpha - beta + np.pi), 2*np.pi)
-        new_alpha = beta - phi + np.pi
+        new_phi = math.fmod((alpha - beta + math.pi), 2*math.pi)
+        new_alpha = beta - phi + math.pi
         new_beta = beta
 
         new_i = [i[0], i[1], new_theta, new_phi, i[4]]
-        new_diags[em], new_diags[en] = np.exp(1j*new_alpha), np.exp(1j*new_beta)
+        new_diags[em], new_diags[en] = cmath.exp(1j*new_alpha), cmath.exp(1j*new_beta)
 
-        new_tlist = new_tlist + [new_i]
+        new_tlist.append(new_i)
 
     return (new_tlist, new_diags)
 
@@ -299,19 +494,18 @@ def mach_zehnder(m, n, internal_phase, external_phase, nmax):
     shifter on mode m, and another symmetric beamsplitter combining modes m
     and n.
     """
-    Rexternal = np.identity(nmax, dtype=np.complex128)
-    Rexternal[m, m] = np.exp(1j * external_phase)
-    Rinternal = np.identity(nmax, dtype=np.complex128)
-    Rinternal[m, m] = np.exp(1j * internal_phase)
-    BS = np.identity(nmax, dtype=np.complex128)
-    BS[m, m] = 1.0 / np.sqrt(2)
-    BS[m, n] = 1.0j / np.sqrt(2)
-    BS[n, m] = 1.0j / np.sqrt(2)
-    BS[n, n] = 1.0 / np.sqrt(2)
-    return BS @ Rinternal @ BS @ Rexternal
-
-
-def rectangular_symmetric(V, tol=1e-11):
+    # The section only acts on modes m and n, so it is built from 2x2
+    # blocks and stamped into a single identity matrix rather than
+    # multiplying three nmax x nmax factors
+    bs = np.array([[1.0, 1.0j], [1.0j, 1.0]]) / np.sqrt(2)
+    rint = np.array([[np.exp(1j * internal_phase), 0.0], [0.0, 1.0]])
+    rext = np.array([[np.exp(1j * external_phase), 0.0], [0.0, 1.0]])
+    mat = _eye_complex(nmax).copy()
+    mat[np.ix_((m, n), (m, n))] = bs @ rint @ bs @ rext
+    return mat
+
+
+def rectangular_symmetric(V, tol=1e-11, check_unitary=True):
     r"""Decomposition of a unitary into an array of symmetric beamsplitters.
 
     This decomposition starts with the output from :func:`clements_phase_end`
@@ -354,6 +548,8 @@ def rectangular_symmetric(V, tol=1e-11):
         V (array): unitary matrix of size n_size
         tol (int): the number of decimal places to use when determining
           whether the matrix is unitary
+        check_unitary (bool): whether to verify that V is unitary. Callers that
+            have already validated V can skip the :math:`O(n^3)` check
 
     Returns:
         tuple[array]: returns a tuple of the form ``(tlist,np.diag(localV))``
@@ -362,24 +558,27 @@ def rectangular_symmetric(V, tol=1e-11):
             * ``tlist``: list containing ``[n,m,internal_phase,external_phase,n_size]`` of the T unitaries needed
             * ``localV``: Diagonal unitary matrix to be applied at the end of circuit
     """
-    tlist, diags = clements_phase_end(V, tol)
-    new_tlist, new_diags = [], np.ones(len(diags), dtype=diags.dtype)
-    for i in tlist:
+    tlist, diags = clements_phase_end(V, tol, check_unitary=check_unitary)
+
+    # The accumulated phases are tracked as plain Python scalars and the
+    # output list is preallocated, keeping the loop free of per-element
+    # NumPy dispatch and of repeated list reallocation
+    phases = [0.0]*len(diags)
+    new_tlist = [None]*len(tlist)
+    for idx, i in enumerate(tlist):
         em, en = int(i[0]), int(i[1])
-        alpha, beta = np.angle(new_diags[em]), np.angle(new_diags[en])
+        alpha, beta = phases[em], phases[en]
         theta, phi = i[2], i[3]
-        external_phase = np.fmod((phi + alpha - beta), 2 * np.pi)
-        internal_phase = np.fmod((np.pi + 2.0 * theta), 2 * np.pi)
-        new_alpha = beta - theta + np.pi
-        new_beta = 0*np.pi - theta + beta
-        new_i = [i[0], i[1], internal_phase, external_phase, i[4]]
-        new_diags[em], new_diags[en] = np.exp(1j*new_alpha), np.exp(1j*new_beta)
-        new_tlist = new_tlist + [new_i]
-    new_diags = diags * new_diags
+        external_phase = math.fmod((phi + alpha - beta), 2 * math.pi)
+        internal_phase = math.fmod((math.pi + 2.0 * theta), 2 * math.pi)
+        phases[em] = beta - theta + math.pi
+        phases[en] = beta - theta
+        new_tlist[idx] = [i[0], i[1], internal_phase, external_phase, i[4]]
+    new_diags = diags * np.exp(1j*np.array(phases))
     return (new_tlist, new_diags)
 
 
-def triangular_decomposition(V, tol=1e-11):
+def triangular_decomposition(V, tol=1e-11, check_unitary=True):
     r"""Triangular decomposition of a unitary matrix due to Reck et al.
 
     See :cite:`reck1994` for more details and :cite:`clements2016` for details on notation.
@@ -388,6 +587,8 @@ def triangular_decomposition(V, tol=1e-11):
         V (array[complex]): unitary matrix of size ``n_size``
         tol (float): the tolerance used when checking if the matrix is unitary:
             :math:`|VV^\dagger-I| \leq` tol
+        check_unitary (bool): whether to verify that V is unitary. Callers that
+            have already validated V can skip the :math:`O(n^3)` check
 
     Returns:
         tuple[array]: returns a tuple of the form ``(tlist,np.diag(localV))``
@@ -396,18 +597,26 @@ def triangular_decomposition(V, tol=1e-11):
             * ``tlist``: list containing ``[n,m,theta,phi,n_size]`` of the T unitaries needed
             * ``localV``: Diagonal unitary applied at the beginning of circuit
     """
-    localV = V
+    localV = np.array(V, dtype=np.complex128)
     (nsize, _) = localV.shape
 
-    diffn = np.linalg.norm(V @ V.conj().T - np.identity(nsize))
-    if diffn >= tol:
-        raise ValueError("The input matrix is not unitary")
+    if check_unitary:
+        diffn = np.linalg.norm(V @ V.conj().T - np.identity(nsize))
+        if diffn >= tol:
+            raise ValueError("The input matrix is not unitary")
 
-    tlist = []
-    for i in range(nsize-2, -1, -1):
-        for j in range(i+1):
-            tlist.append(nullT(nsize-j-1, nsize-i-2, localV))
-            localV = T(*tlist[-1]) @ localV
+    # For one or two modes the decomposition is known in closed form, so
+    # the general nullification machinery is skipped
+    if nsize == 1:
+        return [], np.diag(localV)
+
+    if nsize == 2:
+        gate = nullT(1, 0, localV)
+        _apply_T_left(localV, gate[0], gate[1], gate[2], gate[3])
+        return [gate], np.diag(localV)
+
+    t_params = _triangular_core(localV)
+    tlist = [[int(p[0]), int(p[1]), p[2], p[3], nsize] for p in t_params]
 
     return list(reversed(tlist)), np.diag(localV)
 
@@ -450,38 +659,50 @@ def williamson(V, tol=1e-11):
     n = n//2
     omega = sympmat(n)
     rotmat = changebasis(n)
-    vals = np.linalg.eigvalsh(V)
 
-    for val in vals:
-        if val <= 0:
-            raise ValueError("Input matrix is not positive definite")
+    # V is symmetric, so V^{-1/2} follows directly from its
+    # eigendecomposition in real arithmetic, avoiding both the explicit
+    # inverse and the Schur-based sqrtm; the spectrum doubles as the
+    # positive-definiteness check
+    w, Q = np.linalg.eigh(V)
+    if w[0] <= 0:
+        raise ValueError("Input matrix is not positive definite")
 
-    Mm12 = sqrtm(np.linalg.inv(V)).real
+    Mm12 = (Q * (1.0/np.sqrt(w))) @ Q.T
     r1 = Mm12 @ omega @ Mm12
     s1, K = schur(r1)
-    X = np.array([[0, 1], [1, 0]])
-    I = np.identity(2)
-    seq = []
 
     # In what follows I construct a permutation matrix p  so that the Schur matrix has
     # only positive elements above the diagonal
     # Also the Schur matrix uses the x_1,p_1, ..., x_n,p_n  ordering thus I use rotmat to
     # go to the ordering x_1, ..., x_n, p_1, ... , p_n
-
-    for i in range(n):
-        if s1[2*i, 2*i+1] > 0:
-            seq.append(I)
-        else:
-            seq.append(X)
-
-    p = block_diag(*seq)
+    # p is block diagonal with 2x2 blocks: the identity where
+    # s1[2i, 2i+1] > 0 and the X (swap) matrix otherwise, written with two
+    # vectorized index assignments instead of a Python loop over block_diag
+
+    even = np.arange(0, 2*n, 2)
+    i_idx = even[s1[even, even+1] > 0]
+    x_idx = even[s1[even, even+1] <= 0]
+    p = np.zeros((2*n, 2*n))
+    p[i_idx, i_idx] = 1
+    p[i_idx+1, i_idx+1] = 1
+    p[x_idx, x_idx+1] = 1
+    p[x_idx+1, x_idx] = 1
     Kt = K @ p
     s1t = p @ s1 @ p
-    dd = np.transpose(rotmat) @ s1t @rotmat
     Ktt = Kt @ rotmat
-    Db = np.diag([1/dd[i, i+n] for i in range(n)] + [1/dd[i, i+n]
-                                                     for i in range(n)])
-    S = Mm12 @ Ktt @ sqrtm(Db)
+
+    # Only the entries dd[i, i+n] of dd = rotmat.T @ s1t @ rotmat are needed;
+    # since rotmat is the changebasis permutation (column i has its one at row
+    # 2i, column i+n at row 2i+1), these are just s1t[2i, 2i+1], so the two
+    # dense change-of-basis products are skipped
+    idx = np.arange(n)
+    dvec = s1t[2*idx, 2*idx+1]
+    dbvec = np.concatenate([1/dvec, 1/dvec])
+    Db = np.diag(dbvec)
+    # Db is diagonal, so right-multiplying by its square root is a
+    # column scaling rather than a dense matrix product
+    S = Mm12 @ Ktt * np.sqrt(dbvec)
     return Db, np.linalg.inv(S).T
 
 
@@ -538,21 +759,22 @@ def bloch_messiah(S, tol=1e-10, rounding=9):
         u, sigma = polar(S, side='left')
         ss, uss = takagi(sigma, tol=tol, rounding=rounding)
 
-        # Apply a permutation matrix so that the squeezers appear in the order
-        # s_1,...,s_n, 1/s_1,...1/s_n
+        # Apply a permutation so that the squeezers appear in the order
+        # s_1,...,s_n, 1/s_1,...1/s_n. perm is an involution, so its
+        # permutation matrix is symmetric and self-inverse, and all products
+        # with it reduce to fancy indexing
         perm = np.array(list(range(0, n)) + list(reversed(range(n, 2*n))))
 
-        pmat = np.identity(2*n)[perm, :]
-        ut = uss @ pmat
+        ut = uss[:, perm]
 
-        # Apply a second permutation matrix to permute s
+        # Apply a second permutation to permute s
         # (and their corresonding inverses) to get the canonical symplectic form
         qomega = np.transpose(ut) @ (omega) @ ut
-        st = pmat @ np.diag(ss) @ pmat
+        ss_perm = ss[perm]
 
         # Identifying degenerate subspaces
         result = []
-        for _k, g in groupby(np.round(np.diag(st), rounding)[:n]):
+        for _k, g in groupby(np.round(ss_perm, rounding)[:n]):
             result.append(list(g))
 
         stop_is = list(np.cumsum([len(res) for res in result]))
@@ -560,18 +782,32 @@ def bloch_messiah(S, tol=1e-10, rounding=9):
 
         # Rotation matrices (not permutations) based on svd.
         # See Appendix B2 of Serafini's book for more details.
-        u_list, v_list = [], []
+        # The blocks are stamped directly into a preallocated
+        # block-diagonal matrix, grouped by subspace size: 1x1 subspaces
+        # (non-degenerate squeezers) reduce to the sign of the entry, and
+        # each remaining size is factorized with one batched SVD call
+        pmat1 = np.zeros((2*n, 2*n))
 
+        sizes = {}
         for start_i, stop_i in zip(start_is, stop_is):
-            x = qomega[start_i: stop_i, n + start_i: n + stop_i].real
-            u_svd, _s_svd, v_svd = np.linalg.svd(x)
-            u_list = u_list + [u_svd]
-            v_list = v_list + [v_svd.T]
+            sizes.setdefault(stop_i - start_i, []).append(start_i)
+
+        ones = np.array(sizes.pop(1, []), dtype=int)
+        if ones.size:
+            sgn = np.sign(qomega[ones, n + ones].real)
+            sgn[sgn == 0] = 1.0
+            pmat1[ones, ones] = sgn
+            pmat1[n + ones, n + ones] = 1.0
 
-        pmat1 = block_diag(*(u_list + v_list))
+        for size, starts in sizes.items():
+            x = np.stack([qomega[s: s + size, n + s: n + s + size].real for s in starts])
+            u_svd, _s_svd, v_svd = np.linalg.svd(x)
+            for k, s in enumerate(starts):
+                pmat1[s: s + size, s: s + size] = u_svd[k]
+                pmat1[n + s: n + s + size, n + s: n + s + size] = v_svd[k].T
 
-        st1 = pmat1.T @ pmat @ np.diag(ss) @ pmat @ pmat1
-        ut1 = uss @ pmat @ pmat1
+        st1 = (pmat1.T * ss_perm) @ pmat1
+        ut1 = ut @ pmat1
         v1 = np.transpose(ut1) @ u
 
     else:
@@ -611,14 +847,22 @@ def covmat_to_hamil(V, tol=1e-10):  # pragma: no cover
     n = n//2
     omega = sympmat(n)
 
-    vals = np.linalg.eigvalsh(V)
-    for val in vals:
-        if val <= 0:
-            raise ValueError("Input matrix is not positive definite")
+    # A Cholesky factorization succeeds exactly when the matrix is positive
+    # definite, at roughly half the cost of a full eigvalsh
+    try:
+        cholesky(V, check_finite=False)
+    except LinAlgError:
+        raise ValueError("Input matrix is not positive definite")
 
+    # W is a freshly built temporary, so LAPACK may factorize it in place
     W = 1j*V @ omega
-    l, v = np.linalg.eig(W)
-    H = (1j * omega @ (v @ np.diag(np.arctanh(1.0/l.real)) @ np.linalg.inv(v))).real
+    l, v = eig(W, check_finite=False, overwrite_a=True)
+
+    # v @ diag(d) @ inv(v) computed as a solve against v.T instead of
+    # forming the explicit inverse, with the diagonal factor applied as a
+    # row scaling
+    d = np.arctanh(1.0/l.real)
+    H = (1j * omega @ solve(v.T, d[:, None] * v.T, check_finite=False).T).real
 
     return H
 
@@ -644,15 +888,23 @@ def hamil_to_covmat(H, tol=1e-10):  # pragma: no cover
     if np.linalg.norm(H-np.transpose(H)) >= tol:
         raise ValueError("The input matrix is not symmetric")
 
-    vals = np.linalg.eigvalsh(H)
-    for val in vals:
-        if val <= 0:
-            raise ValueError("Input matrix is not positive definite")
+    # A Cholesky factorization succeeds exactly when the matrix is positive
+    # definite, at roughly half the cost of a full eigvalsh
+    try:
+        cholesky(H, check_finite=False)
+    except LinAlgError:
+        raise ValueError("Input matrix is not positive definite")
 
     n = n//2
     omega = sympmat(n)
 
+    # Wi is a freshly built temporary, so LAPACK may factorize it in place
     Wi = 1j*omega @ H
-    l, v = np.linalg.eig(Wi)
-    V = (1j * (v @ np.diag(1.0/np.tanh(l.real)) @ np.linalg.inv(v)) @ omega).real
+    l, v = eig(Wi, check_finite=False, overwrite_a=True)
+
+    # v @ diag(d) @ inv(v) computed as a solve against v.T instead of
+    # forming the explicit inverse, with the diagonal factor applied as a
+    # row scaling
+    d = 1.0/np.tanh(l.real)
+    V = (1j * solve(v.T, d[:, None] * v.T, check_finite=False).T @ omega).real
     return V
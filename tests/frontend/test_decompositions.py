@@ -84,6 +84,27 @@ class TestTakagi:
         res = U @ np.diag(rl) @ U.T
         assert np.allclose(res, A, atol=tol, rtol=0)
 
+    def test_degenerate_symm(self, tol):
+        """Verify that the Takagi decomposition, applied to a complex symmetric
+        matrix with degenerate singular values, produced a decomposition that
+        can be used to reconstruct the matrix."""
+        U = haar_measure(6)
+        d = np.array([3.0, 3.0, 2.0, 2.0, 1.0, 1.0])
+        A = U @ np.diag(d) @ U.T
+        rl, W = dec.takagi(A)
+        assert np.allclose(rl, d, atol=tol, rtol=0)
+        assert np.allclose(W @ np.diag(rl) @ W.T, A, atol=tol, rtol=0)
+
+    def test_real_symm(self, tol):
+        """Verify that the Takagi decomposition, applied to a random real symmetric
+        matrix (which in general has negative eigenvalues), produced a decomposition
+        that can be used to reconstruct the matrix."""
+        A = np.random.random([6, 6])
+        A += A.T
+        rl, U = dec.takagi(A)
+        res = U @ np.diag(rl) @ U.T
+        assert np.allclose(res, A, atol=tol, rtol=0)
+
 
 class TestGraphEmbed:
     """graph_embed tests"""
@@ -189,6 +210,26 @@ class TestRectangularDecomposition:
 
         assert np.allclose(U, qrec, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("n", [1, 2])
+    def test_small_unitary(self, n, tol):
+        """This test checks the one- and two-mode closed-form paths of the
+        rectangular decomposition against reconstruction of a random unitary."""
+        U = haar_measure(n)
+
+        tilist, tlist, diags = dec.clements(U)
+
+        qrec = np.identity(n)
+
+        for i in tilist:
+            qrec = dec.T(*i) @ qrec
+
+        qrec = np.diag(diags) @ qrec
+
+        for i in reversed(tlist):
+            qrec = dec.Ti(*i) @ qrec
+
+        assert np.allclose(U, qrec, atol=tol, rtol=0)
+
     def test_random_unitary_phase_end(self, tol):
         """This test checks the rectangular decomposition with phases at the end.
 
@@ -309,6 +350,21 @@ class TestTriangularDecomposition:
 
         assert np.allclose(U, qrec, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("n", [1, 2])
+    def test_small_unitary(self, n, tol):
+        """This test checks the one- and two-mode closed-form paths of the
+        triangular decomposition against reconstruction of a random unitary."""
+        U = haar_measure(n)
+
+        tlist, diags = dec.triangular_decomposition(U)
+
+        qrec = np.diag(diags)
+
+        for i in tlist:
+            qrec = dec.Ti(*i) @ qrec
+
+        assert np.allclose(U, qrec, atol=tol, rtol=0)
+
 
 class TestWilliamsonDecomposition:
     """Tests for the Williamson decomposition"""
@@ -453,12 +509,13 @@ class TestBlochMessiahDecomposition:
         Args:
             n (int): number of modes
             passive (bool): whether transform should be passive or not
+            r (array): optional squeezing parameters for an active transform
 
         Returns:
             array: symplectic matrix
         """
 
-        def _create_transform(n, passive=True):
+        def _create_transform(n, passive=True, r=None):
             """wrapped function"""
             O = omega(n)
 
@@ -471,7 +528,8 @@ class TestBlochMessiahDecomposition:
             Sq = np.identity(2 * n)
             if not passive:
                 # squeezing
-                r = np.log(0.2 * np.arange(n) + 2)
+                if r is None:
+                    r = np.log(0.2 * np.arange(n) + 2)
                 Sq = block_diag(np.diag(np.exp(-r)), np.diag(np.exp(r)))
 
             # interferometer 2
@@ -572,3 +630,23 @@ class TestBlochMessiahDecomposition:
         assert np.allclose(O1.T @ O @ O1, O, atol=tol, rtol=0)
         assert np.allclose(O2.T @ O @ O2, O, atol=tol, rtol=0)
         assert np.allclose(S @ O @ S.T, O, atol=tol, rtol=0)
+
+    def test_active_transform_degenerate(self, create_transform, tol):
+        """Test active transform with repeated squeezing values,
+        which exercises the degenerate squeezer subspaces"""
+        n = 3
+        S_in = create_transform(3, passive=False, r=np.array([0.5, 0.5, 0.2]))
+        O1, S, O2 = dec.bloch_messiah(S_in)
+
+        # test decomposition
+        assert np.allclose(O1 @ S @ O2, S_in, atol=tol, rtol=0)
+
+        # test orthogonality
+        assert np.allclose(O1.T @ O1, np.identity(2 * n), atol=tol, rtol=0)
+        assert np.allclose(O2.T @ O2, np.identity(2 * n), atol=tol, rtol=0)
+
+        # test symplectic
+        O = omega(n)
+        assert np.allclose(O1.T @ O @ O1, O, atol=tol, rtol=0)
+        assert np.allclose(O2.T @ O @ O2, O, atol=tol, rtol=0)
+        assert np.allclose(S @ O @ S.T, O, atol=tol, rtol=0)